@@ -36,8 +36,8 @@ import logging
 from ruamel.yaml import YAML
 from collections import OrderedDict
 
-# Use ruamel.yaml instead of PyYAML
-YAML = YAML()
+# Use ruamel.yaml's safe loader, the config is only read here
+YAML = YAML(typ="safe")
 
 # Directories and Paths
 BASE_DIR = os.path.dirname(os.path.realpath(__file__))
@@ -94,7 +94,7 @@ def load_state():
     Load the state from the state file if it exists, else return an initial state.
     """
     if os.path.exists(DATA_FILE):
-        with open(DATA_FILE, "r") as file:
+        with open(DATA_FILE, "r", encoding="utf-8") as file:
             state = json.load(file)
             state["alertscript_alerts"] = state.get("alertscript_alerts", [])
 
@@ -289,7 +289,10 @@ def main(index_or_title):
 
             # Count the unique instances of the alert
             unique_instances = len(
-                set((data["description"], data["end_time_utc"]) for data in alert_data)
+                set(
+                    (data["description"], data.get("end_ts", data.get("end_time_utc")))
+                    for data in alert_data
+                )
             )
 
             # Modify the description
@@ -308,7 +311,10 @@ def main(index_or_title):
                 # Count the unique instances of the alert
                 unique_instances = len(
                     set(
-                        (data["description"], data["end_time_utc"])
+                        (
+                            data["description"],
+                            data.get("end_ts", data.get("end_time_utc")),
+                        )
                         for data in alert_data
                     )
                 )
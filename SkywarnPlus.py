@@ -31,34 +31,89 @@ You should have received a copy of the GNU General Public License along with Sky
 import os
 import json
 import logging
+from logging.handlers import RotatingFileHandler
 import requests
+from requests.adapters import HTTPAdapter
 import shutil
 import fnmatch
+import filecmp
+import re
 import subprocess
 import time
-import wave
-import contextlib
 import math
 import sys
 import itertools
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from dateutil import parser
 from pydub import AudioSegment
 from ruamel.yaml import YAML
 from collections import OrderedDict
 
-# Use ruamel.yaml instead of PyYAML
-yaml = YAML()
+try:
+    # orjson is optional, but serializes the state much faster than the json module
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Prefer PyYAML's libyaml-backed loader for reading the config when it is available
+    from yaml import load as yaml_load, CSafeLoader
+except ImportError:
+    yaml_load = None
+
+# Use ruamel.yaml's safe loader when PyYAML isn't available, it returns plain
+# dictionaries and lists since the config is only ever read here
+yaml = YAML(typ="safe")
 
 # Directories and Paths
 BASE_DIR = os.path.dirname(os.path.realpath(__file__))
 CONFIG_PATH = os.path.join(BASE_DIR, "config.yaml")
+CONFIG_CACHE_PATH = CONFIG_PATH + ".cache.json"
 COUNTY_CODES_PATH = os.path.join(BASE_DIR, "CountyCodes.md")
 
+
+def load_config():
+    """
+    Load the configuration file, using the JSON cache of the parsed config
+    whenever it was built from the current config.yaml.
+    """
+    # Stat config.yaml before parsing it, so an edit made while it is being read
+    # leaves the cache stale rather than newer than the config
+    config_stat = os.stat(CONFIG_PATH)
+    config_key = [config_stat.st_mtime_ns, config_stat.st_size]
+
+    try:
+        with open(CONFIG_CACHE_PATH, "r") as cache_file:
+            cache = json.load(cache_file)
+        if isinstance(cache, dict) and cache.get("key") == config_key:
+            return cache["config"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    # Cache is missing or stale, parse config.yaml
+    with open(CONFIG_PATH, "r") as config_file:
+        if yaml_load is not None:
+            config = yaml_load(config_file, Loader=CSafeLoader)
+        else:
+            config = yaml.load(config_file)
+
+    # Round trip the config through JSON so it has the same types as when it
+    # comes from the cache, then refresh the cache. It is fine if we can't write it
+    try:
+        cache_data = json.dumps({"key": config_key, "config": config})
+        config = json.loads(cache_data)["config"]
+        with open(CONFIG_CACHE_PATH, "w") as cache_file:
+            cache_file.write(cache_data)
+    except (OSError, TypeError, ValueError):
+        pass
+
+    return config
+
+
 # Open and read configuration file
-with open(CONFIG_PATH, "r") as config_file:
-    config = yaml.load(config_file)
-    config = json.loads(json.dumps(config))  # Convert config to a normal dictionary
+config = load_config()
 
 # Define whether SkywarnPlus is enabled in config.yaml
 MASTER_ENABLE = config.get("SKYWARNPLUS", {}).get("Enable", False)
@@ -88,6 +143,84 @@ TAILMESSAGE_BLOCKED_EVENTS = config.get("Blocking", {}).get(
 if TAILMESSAGE_BLOCKED_EVENTS is None:
     TAILMESSAGE_BLOCKED_EVENTS = []
 
+
+def compile_event_patterns(event_patterns):
+    """
+    Build a function that checks an event against a list of wildcard event patterns,
+    such as blocked events or AlertScript triggers. Plain event names are checked
+    with a set lookup, and only the patterns with wildcards are combined into a
+    single compiled regular expression.
+    """
+    literals = frozenset(
+        event_pattern
+        for event_pattern in event_patterns
+        if not any(char in event_pattern for char in "*?[")
+    )
+    pattern = "|".join(
+        "(?:{})".format(fnmatch.translate(event_pattern))
+        for event_pattern in event_patterns
+        if event_pattern not in literals
+    )
+    # Without any wildcard patterns, only the literal names can match
+    if not pattern:
+        return literals.__contains__
+    event_re = re.compile(pattern)
+
+    def matches(event):
+        return event in literals or event_re.match(event) is not None
+
+    return matches
+
+
+# Precompile the blocked event patterns
+is_globally_blocked = compile_event_patterns(GLOBAL_BLOCKED_EVENTS)
+is_sayalert_blocked = compile_event_patterns(SAYALERT_BLOCKED_EVENTS)
+is_tailmessage_blocked = compile_event_patterns(TAILMESSAGE_BLOCKED_EVENTS)
+
+# Define alert sound effect paths
+ALERT_SEPARATOR_FILE = os.path.join(
+    SOUNDS_PATH,
+    "ALERTS",
+    "EFFECTS",
+    config.get("Alerting", {}).get("AlertSeperator", "Woodblock.wav"),
+)
+ALERT_SOUND_FILE = os.path.join(
+    SOUNDS_PATH,
+    "ALERTS",
+    "EFFECTS",
+    config.get("Alerting", {}).get("AlertSound", "Duncecap.wav.wav"),
+)
+
+# Define the "multiple instances" announcement path
+MULTIPLES_FILE = os.path.join(SOUNDS_PATH, "ALERTS", "SWP_149.wav")
+
+
+def make_silence(duration):
+    """
+    Create a silent AudioSegment of the given duration in ms, directly in the
+    8000Hz mono 16-bit format the sounds are joined in.
+    """
+    return AudioSegment(
+        data=bytes(int(8 * duration) * 2),
+        sample_width=2,
+        frame_rate=8000,
+        channels=1,
+    )
+
+
+# Silences used to space out the sounds, generated once
+SILENCE = {duration: make_silence(duration) for duration in (100, 200, 400, 600, 1000)}
+
+# Define mappings to convert severity levels from various terminologies to a numeric scale
+SEVERITY_MAPPING_API = {
+    "Extreme": 4,
+    "Severe": 3,
+    "Moderate": 2,
+    "Minor": 1,
+    "Unknown": 0,
+}
+SEVERITY_MAPPING_WORDS = {"Warning": 4, "Watch": 3, "Advisory": 2, "Statement": 1}
+
 # Define Max Alerts
 MAX_ALERTS = config.get("Alerting", {}).get("MaxAlerts", 99)
 
@@ -108,6 +241,12 @@ ENABLE_IDCHANGE = IDCHANGE_CONFIG.get("Enable", False)
 # Data file path
 DATA_FILE = os.path.join(TMP_DIR, "data.json")
 
+# State file contents as last read or written, used to skip identical writes
+STATE_FILE_DATA = None
+
+# Pre-rendered silent WAV copied over the tailmessage when there is nothing to say
+SILENCE_FILE = os.path.join(TMP_DIR, "silence.wav")
+
 # Tones directory
 TONE_DIR = config["CourtesyTones"].get("ToneDir", os.path.join(SOUNDS_PATH, "TONES"))
 
@@ -246,6 +385,9 @@ ALERT_STRINGS = [
 # Generate the WA list based on the length of WS
 ALERT_INDEXES = [str(i + 1) for i in range(len(ALERT_STRINGS))]
 
+# Map each alert string to its WA index
+ALERT_INDEX = {alert: str(i + 1) for i, alert in enumerate(ALERT_STRINGS)}
+
 # Test if the script needs to start from a clean slate
 CLEANSLATE = config.get("DEV", {}).get("CLEANSLATE", False)
 if CLEANSLATE:
@@ -257,6 +399,10 @@ LOG_CONFIG = config.get("Logging", {})
 ENABLE_DEBUG = LOG_CONFIG.get("Debug", False)
 LOG_FILE = LOG_CONFIG.get("LogPath", os.path.join(TMP_DIR, "SkywarnPlus.log"))
 
+# Whether SkywarnPlus is being run interactively rather than from cron, this can't
+# change while the script runs so it is only checked once
+IS_TTY = sys.stdin.isatty()
+
 # Set up logging
 LOGGER = logging.getLogger(__name__)
 LOGGER.setLevel(logging.DEBUG if ENABLE_DEBUG else logging.INFO)
@@ -264,45 +410,72 @@ LOGGER.setLevel(logging.DEBUG if ENABLE_DEBUG else logging.INFO)
 # Set up log message formatting
 LOG_FORMATTER = logging.Formatter("%(asctime)s %(levelname)s %(message)s")
 
-# Set up console log handler
-C_HANDLER = logging.StreamHandler()
-C_HANDLER.setFormatter(LOG_FORMATTER)
-LOGGER.addHandler(C_HANDLER)
+# Set up console log handler, only when running in a terminal rather than from cron
+if sys.stdout.isatty():
+    C_HANDLER = logging.StreamHandler()
+    C_HANDLER.setFormatter(LOG_FORMATTER)
+    LOGGER.addHandler(C_HANDLER)
 
-# Set up file log handler
-F_HANDLER = logging.FileHandler(LOG_FILE)
+# Set up file log handler, the file is only opened once something is logged and
+# is rotated so it can't grow without bound
+F_HANDLER = RotatingFileHandler(LOG_FILE, maxBytes=2000000, backupCount=3, delay=True)
 F_HANDLER.setFormatter(LOG_FORMATTER)
 LOGGER.addHandler(F_HANDLER)
 
 # Get the "CountyCodes" from the config
 COUNTY_CODES_CONFIG = config.get("Alerting", {}).get("CountyCodes", [])
 
-# Initialize COUNTY_CODES and COUNTY_WAVS
-COUNTY_CODES = []
-COUNTY_WAVS = []
-
-# Check the type of "CountyCodes" config to handle both list and dictionary
-if isinstance(COUNTY_CODES_CONFIG, list):
-    # If it's a list, check if it's a list of strings or dictionaries
-    if all(isinstance(i, str) for i in COUNTY_CODES_CONFIG):
-        # It's the old format and we can use it directly
-        COUNTY_CODES = COUNTY_CODES_CONFIG
-    elif all(isinstance(i, dict) for i in COUNTY_CODES_CONFIG):
-        # It's a list of dictionaries with WAV files
-        # We need to separate the county codes and the WAVs
-        for dic in COUNTY_CODES_CONFIG:
-            for key, value in dic.items():
-                COUNTY_CODES.append(key)
-                COUNTY_WAVS.append(value)
-elif isinstance(COUNTY_CODES_CONFIG, dict):
+
+def normalize_counties(county_codes_config):
+    """
+    Split the "CountyCodes" config into a list of county codes and a list of
+    their WAV files in a single pass. Handles the old list of strings format,
+    a list of dictionaries and a dictionary.
+    """
     # If it's a dictionary, it's got WAV files
-    # We need to separate the county codes and the WAVs
-    COUNTY_CODES = list(COUNTY_CODES_CONFIG.keys())
-    COUNTY_WAVS = list(COUNTY_CODES_CONFIG.values())
-else:
-    # Invalid format, set it to an empty list
-    COUNTY_CODES = []
-    COUNTY_WAVS = []
+    if isinstance(county_codes_config, dict):
+        return list(county_codes_config.keys()), list(county_codes_config.values())
+
+    # Invalid format, use empty lists
+    if not isinstance(county_codes_config, list):
+        return [], []
+
+    codes = []
+    wavs = []
+    has_strings = False
+    for item in county_codes_config:
+        if isinstance(item, str):
+            # It's the old format and we can use it directly
+            has_strings = True
+            codes.append(item)
+        elif isinstance(item, dict):
+            # It's a dictionary with WAV files, separate the county codes and the WAVs
+            for key, value in item.items():
+                codes.append(key)
+                wavs.append(value)
+        else:
+            return [], []
+
+    # A list mixing both formats can't line the WAVs up with the codes
+    if has_strings and wavs:
+        return [], []
+
+    return codes, wavs
+
+
+# Separate the county codes and their WAV files
+COUNTY_CODES, COUNTY_WAVS = normalize_counties(COUNTY_CODES_CONFIG)
+
+# Map each county code to its WAV file
+COUNTY_WAV_MAP = dict(zip(COUNTY_CODES, COUNTY_WAVS))
+
+# County changes are only worth announcing when County IDs have been set up and there
+# is more than one county code
+ANNOUNCE_COUNTY_CHANGES = bool(COUNTY_WAVS) and len(COUNTY_CODES) > 1
+
+# Shared HTTP session so connections to the NWS and Pushover APIs are kept alive and reused
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
 
 # Log some debugging information
 LOGGER.debug("Base directory: %s", BASE_DIR)
@@ -327,26 +500,41 @@ def validate_last_alerts_structure(last_alerts):
             return False
     return True
 
+
 def load_state():
     """
     Load the state from the state file if it exists, else return an initial state.
     Validates and fixes any structural issues with `last_alerts`.
     """
+    global STATE_FILE_DATA
+
     # Check if the state data file exists
     if os.path.exists(DATA_FILE):
         try:
-            with open(DATA_FILE, "r") as file:
-                state = json.load(file)
+            # The state file is always written as UTF-8, so read the raw bytes and
+            # decode them rather than relying on the locale's encoding
+            with open(DATA_FILE, "rb") as file:
+                data = file.read()
+                state = json.loads(data.decode("utf-8"))
+                STATE_FILE_DATA = data
 
                 # Ensure 'alertscript_alerts' key is present in the state, default to an empty list
                 state["alertscript_alerts"] = state.get("alertscript_alerts", [])
 
                 # Process 'last_alerts' key to maintain the order of alerts using OrderedDict
                 last_alerts = state.get("last_alerts", [])
-                
+
                 # Validate the structure of last_alerts
                 if validate_last_alerts_structure(last_alerts):
                     state["last_alerts"] = OrderedDict((x[0], x[1]) for x in last_alerts)
+
+                    # Upgrade alerts saved by older versions, which stored end times as strings
+                    for alert_list in state["last_alerts"].values():
+                        for alert in alert_list:
+                            if "end_ts" not in alert and "end_time_utc" in alert:
+                                alert["end_ts"] = int(
+                                    parse_time(alert.pop("end_time_utc")).timestamp()
+                                )
                 else:
                     LOGGER.error("Invalid format in 'last_alerts'. Resetting to default.")
                     state["last_alerts"] = OrderedDict()
@@ -357,7 +545,7 @@ def load_state():
 
                 return state
 
-        except (json.JSONDecodeError, IOError) as e:
+        except (json.JSONDecodeError, UnicodeDecodeError, IOError) as e:
             LOGGER.error("Failed to load state from %s: %s", DATA_FILE, e)
             # Return default state in case of failure
             return {
@@ -380,48 +568,95 @@ def load_state():
         }
 
 
-def save_state(state):
+def save_state(state, state_dirty=True):
     """
     Save the state to the state file.
     Converts OrderedDict and other complex structures into lists before saving.
+    If state_dirty is False the state is known to be unchanged, and nothing is written.
+    The file is also left alone if the serialized state matches what is already in it.
     """
+    global STATE_FILE_DATA
+
+    if not state_dirty:
+        LOGGER.debug("State is unchanged, not saving to %s.", DATA_FILE)
+        return
+
     try:
-        # Convert 'alertscript_alerts', 'last_sayalert', and 'active_alerts' keys to lists
-        state["alertscript_alerts"] = list(state["alertscript_alerts"])
-        state["last_sayalert"] = list(state["last_sayalert"])
-        state["active_alerts"] = list(state["active_alerts"])
+        # Convert 'alertscript_alerts' and 'active_alerts' keys to lists if they are sets.
+        # 'last_sayalert' is left alone, as it maps alerts to counties and must stay a dictionary
+        # for say_alerts to compare against it.
+        for key in ("alertscript_alerts", "active_alerts"):
+            if isinstance(state[key], set):
+                state[key] = list(state[key])
 
         # Convert 'last_alerts' from OrderedDict to list of tuples (for JSON compatibility)
         if isinstance(state["last_alerts"], OrderedDict):
             state["last_alerts"] = list(state["last_alerts"].items())
 
-        # Save the state to the data file in a formatted manner
-        with open(DATA_FILE, "w") as file:
-            json.dump(state, file, ensure_ascii=False, indent=4)
-            LOGGER.debug("Successfully saved state to %s.", DATA_FILE)
+        # Serialize the state in a compact manner
+        if orjson is not None:
+            data = orjson.dumps(state)
+        else:
+            data = json.dumps(state, ensure_ascii=False, separators=(",", ":")).encode(
+                "utf-8"
+            )
+
+        # Skip the write if the file already holds exactly this state
+        if data == STATE_FILE_DATA and os.path.exists(DATA_FILE):
+            LOGGER.debug("State matches %s, not saving.", DATA_FILE)
+            return
+
+        # Write the state to a temporary file, then move it into place so the data file
+        # is never left partially written
+        tmp_file = DATA_FILE + ".tmp"
+        with open(tmp_file, "wb") as file:
+            file.write(data)
+        os.replace(tmp_file, DATA_FILE)
+        STATE_FILE_DATA = data
+        LOGGER.debug("Successfully saved state to %s.", DATA_FILE)
 
     except (TypeError, IOError) as e:
         LOGGER.error("Failed to save state: %s", e)
 
 
+def parse_time(time_str):
+    """
+    Convert an ISO 8601 time string, as used by the NWS API, into a datetime object.
+    """
+    try:
+        return datetime.fromisoformat(time_str.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        # datetime.fromisoformat is only available on Python 3.7+, and is stricter than dateutil
+        return parser.isoparse(time_str)
+
+
+def fetch_county_alerts(countyCode):
+    """
+    Retrieve the active alerts for a single county code from the NWS API.
+    Returns the county code along with the decoded response, or the exception raised.
+    """
+    url = "https://api.weather.gov/alerts/active?zone={}".format(countyCode)
+    print(url)
+    #
+    # WARNING: ONLY USE THIS FOR DEVELOPMENT PURPOSES
+    # THIS URL WILL RETURN ALL ACTIVE ALERTS IN THE UNITED STATES
+    # url = "https://api.weather.gov/alerts/active"
+    try:
+        response = SESSION.get(url)
+        response.raise_for_status()
+        LOGGER.debug("getAlerts: Checking for alerts in %s at URL: %s", countyCode, url)
+        return countyCode, response.json()
+    except requests.exceptions.RequestException as e:
+        return countyCode, e
+
+
 def get_alerts(countyCodes):
     """
     Retrieves severe weather alerts for specified county codes and processes them.
     """
 
-    # Define mappings to convert severity levels from various terminologies to a numeric scale
-    severity_mapping_api = {
-        "Extreme": 4,
-        "Severe": 3,
-        "Moderate": 2,
-        "Minor": 1,
-        "Unknown": 0,
-    }
-    severity_mapping_words = {"Warning": 4, "Watch": 3, "Advisory": 2, "Statement": 1}
-
-    # Initialize storage for the alerts and a set to keep track of processed alerts
+    # Initialize storage for the alerts
     alerts = OrderedDict()
-    seen_alerts = set()
 
     # Log current time for reference
     current_time = datetime.now(timezone.utc)
@@ -445,8 +680,8 @@ def get_alerts(countyCodes):
             else:
                 continue  # Ignore if not a dictionary
 
-            last_word = alert_title.split()[-1]
-            severity = severity_mapping_words.get(last_word, 0)
+            last_word = alert_title.rsplit(" ", 1)[-1]
+            severity = SEVERITY_MAPPING_WORDS.get(last_word, 0)
             description = "This alert was manually injected as a test."
 
             end_time_str = alert_info.get("EndTime")
@@ -472,7 +707,9 @@ def get_alerts(countyCodes):
                     county = next(county_codes_cycle)
 
                 end_time = (
-                    datetime.strptime(end_time_str, "%Y-%m-%dT%H:%M:%SZ")
+                    datetime.strptime(end_time_str, "%Y-%m-%dT%H:%M:%SZ").replace(
+                        tzinfo=timezone.utc
+                    )
                     if end_time_str
                     else current_time + timedelta(hours=1)
                 )
@@ -482,7 +719,7 @@ def get_alerts(countyCodes):
                         "county_code": county,
                         "severity": severity,
                         "description": description,
-                        "end_time_utc": end_time.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+                        "end_ts": int(end_time.timestamp()),
                     }
                 )
 
@@ -511,71 +748,94 @@ def get_alerts(countyCodes):
         time_type_start = "onset"
         time_type_end = "ends"
 
-    # Loop over each county code and retrieve alerts from the API.
-    for countyCode in countyCodes:
-        url = "https://api.weather.gov/alerts/active?zone={}".format(countyCode)
-        print(url)
-        #
-        # WARNING: ONLY USE THIS FOR DEVELOPMENT PURPOSES
-        # THIS URL WILL RETURN ALL ACTIVE ALERTS IN THE UNITED STATES
-        # url = "https://api.weather.gov/alerts/active"
-        try:
-            # If we can get a successful response from the API, we process the alerts from the response.
-            response = requests.get(url)
-            response.raise_for_status()
+    # Retrieve alerts for each county code from the API in parallel, then process the
+    # responses in the order the county codes were given.
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(countyCodes)))) as executor:
+        responses = list(executor.map(fetch_county_alerts, countyCodes))
+
+    for countyCode, alert_data in responses:
+        # If the API could not be reached, we use the stored alerts instead.
+        if isinstance(alert_data, requests.exceptions.RequestException):
             LOGGER.debug(
-                "getAlerts: Checking for alerts in %s at URL: %s", countyCode, url
+                "Failed to retrieve alerts for %s. Reason: %s", countyCode, alert_data
             )
-            alert_data = response.json()
-            for feature in alert_data["features"]:
-                # Extract start and end times. If end time is missing, use 'expires' time.
-                start = feature["properties"].get(time_type_start)
-                end = feature["properties"].get(time_type_end)
-                if not end:
-                    end = feature["properties"].get("expires")
-                    LOGGER.debug(
-                        'getAlerts: %s has no "%s" time, using "expires" time instead: %s',
-                        feature["properties"]["event"],
-                        time_type_end,
-                        end,
-                    )
-                if start and end:
-                    # If both start and end times are available, convert them to datetime objects.
-                    start_time = parser.isoparse(start)
-                    end_time = parser.isoparse(end)
-
-                    # Convert alert times to UTC.
-                    start_time_utc = start_time.astimezone(timezone.utc)
-                    end_time_utc = end_time.astimezone(timezone.utc)
-                    event = feature["properties"]["event"]
-
-                    # If the current time is within the alert's active period, we process it further.
-                    if start_time_utc <= current_time < end_time_utc:
-                        description = feature["properties"].get("description", "")
-                        severity = feature["properties"].get("severity", None)
-
-                        # Check if the event is globally blocked as per the configuration. If it is, skip this event.
-                        is_blocked = False
-                        for global_blocked_event in GLOBAL_BLOCKED_EVENTS:
-                            if fnmatch.fnmatch(event, global_blocked_event):
-                                LOGGER.debug(
-                                    "getAlerts: Globally Blocking %s as per configuration",
-                                    event,
-                                )
-                                is_blocked = True
-                                break
-                        # If the event is globally blocked, we skip the remaining code in this loop iteration and move to the next one.
-                        if is_blocked:
-                            continue
-
-                        # Determine severity from event name or API's severity value.
-                        if severity is None:
-                            last_word = event.split()[-1]
-                            severity = severity_mapping_words.get(last_word, 0)
-                        else:
-                            severity = severity_mapping_api.get(severity, 0)
-
-                        # Log the alerts and their severity level for debugging purposes.
+            LOGGER.debug("API unreachable. Using stored data instead.")
+
+            # Load alerts from data.json
+            if os.path.isfile(DATA_FILE):
+                stored_alerts = load_state()["last_alerts"]
+
+                # Filter alerts by end_ts
+                current_ts = int(current_time.timestamp())
+                LOGGER.debug("Current time: %s", current_time)
+                alerts = {
+                    event: [
+                        alert for alert in alert_list if alert["end_ts"] >= current_ts
+                    ]
+                    for event, alert_list in stored_alerts.items()
+                }
+                # Drop events whose alerts have all expired
+                alerts = {
+                    event: alert_list
+                    for event, alert_list in alerts.items()
+                    if alert_list
+                }
+                LOGGER.debug(
+                    "getAlerts: Keeping %s unexpired stored alerts: %s",
+                    len(alerts),
+                    list(alerts.keys()),
+                )
+            else:
+                LOGGER.error("No stored data available.")
+            break
+
+        # If we got a successful response from the API, we process the alerts from the response.
+        for feature in alert_data["features"]:
+            event = feature["properties"]["event"]
+
+            # Check if the event is globally blocked as per the configuration. If it is, skip this event
+            # before doing any further work on it.
+            if is_globally_blocked(event):
+                LOGGER.debug(
+                    "getAlerts: Globally Blocking %s as per configuration",
+                    event,
+                )
+                continue
+
+            # Extract start and end times. If end time is missing, use 'expires' time.
+            start = feature["properties"].get(time_type_start)
+            end = feature["properties"].get(time_type_end)
+            if not end:
+                end = feature["properties"].get("expires")
+                LOGGER.debug(
+                    'getAlerts: %s has no "%s" time, using "expires" time instead: %s',
+                    event,
+                    time_type_end,
+                    end,
+                )
+            if start and end:
+                # If both start and end times are available, convert them to datetime objects.
+                start_time = parse_time(start)
+                end_time = parse_time(end)
+
+                # Convert alert times to UTC.
+                start_time_utc = start_time.astimezone(timezone.utc)
+                end_time_utc = end_time.astimezone(timezone.utc)
+
+                # If the current time is within the alert's active period, we process it further.
+                if start_time_utc <= current_time < end_time_utc:
+                    description = feature["properties"].get("description", "")
+                    severity = feature["properties"].get("severity", None)
+
+                    # Determine severity from event name or API's severity value.
+                    if severity is None:
+                        last_word = event.rsplit(" ", 1)[-1]
+                        severity = SEVERITY_MAPPING_WORDS.get(last_word, 0)
+                    else:
+                        severity = SEVERITY_MAPPING_API.get(severity, 0)
+
+                    # Log the alerts and their severity level for debugging purposes.
+                    if LOGGER.isEnabledFor(logging.DEBUG):
                         LOGGER.debug(
                             "getAlerts: %s - %s - Severity: %s",
                             countyCode,
@@ -583,110 +843,42 @@ def get_alerts(countyCodes):
                             severity,
                         )
 
-                        # Check if the event has already been processed (seen).
-                        # If it has been seen, we add a new dictionary to its list of alerts. This dictionary contains details about the alert.
-                        if event in seen_alerts:
-                            alerts[event].append(
-                                {
-                                    "county_code": countyCode,  # the county code the alert is for
-                                    "severity": severity,  # the severity level of the alert
-                                    "description": description,  # a description of the alert
-                                    "end_time_utc": end_time_utc.strftime(
-                                        "%Y-%m-%dT%H:%M:%S.%fZ"
-                                    ),  # the time the alert ends in UTC
-                                }
-                            )
-                        # If the event hasn't been seen before, we create a new list entry in the 'alerts' dictionary for this event.
-                        else:
-                            alerts[event] = [
-                                {
-                                    "county_code": countyCode,  # the county code the alert is for
-                                    "severity": severity,  # the severity level of the alert
-                                    "description": description,  # a description of the alert
-                                    "end_time_utc": end_time_utc.strftime(
-                                        "%Y-%m-%dT%H:%M:%S.%fZ"
-                                    ),  # the time the alert ends in UTC
-                                }
-                            ]
-                            # Add the event to the set of seen alerts.
-                            seen_alerts.add(event)
-
-                    # If the current time is not within the alert's active period, we skip it.
-                    else:
-                        time_difference = time_until(start_time_utc, current_time)
-                        LOGGER.debug(
-                            "getAlerts: Skipping %s, not active for another %s.",
-                            event,
-                            time_difference,
-                        )
-                        LOGGER.debug(
-                            "Current time: %s | Alert start: %s | Alert end %s",
-                            current_time,
-                            start_time_utc,
-                            end_time_utc,
-                        )
-                else:
-                    LOGGER.debug(
-                        "getAlerts: Skipping %s, missing start or end time.",
-                        feature["properties"]["event"],
+                    # Add a dictionary with details about the alert to the list of alerts for this event,
+                    # creating the list if this is the first time we've seen the event.
+                    alerts.setdefault(event, []).append(
+                        {
+                            "county_code": countyCode,  # the county code the alert is for
+                            "severity": severity,  # the severity level of the alert
+                            "description": description,  # a description of the alert
+                            "end_ts": int(
+                                end_time_utc.timestamp()
+                            ),  # the time the alert ends as a UTC epoch timestamp
+                        }
                     )
 
-        except requests.exceptions.RequestException as e:
-            LOGGER.debug("Failed to retrieve alerts for %s. Reason: %s", countyCode, e)
-            LOGGER.debug("API unreachable. Using stored data instead.")
-
-            # Load alerts from data.json
-            if os.path.isfile(DATA_FILE):
-                with open(DATA_FILE) as f:
-                    data = json.load(f)
-                    stored_alerts = data.get("last_alerts", [])
-
-                    # Filter alerts by end_time_utc
-                    current_time_str = datetime.now(timezone.utc).strftime(
-                        "%Y-%m-%dT%H:%M:%S.%fZ"
+                # If the current time is not within the alert's active period, we skip it.
+                # The time until it starts is only worked out when debug logging is on.
+                elif LOGGER.isEnabledFor(logging.DEBUG):
+                    time_difference = time_until(start_time_utc, current_time)
+                    LOGGER.debug(
+                        "getAlerts: Skipping %s, not active for another %s.",
+                        event,
+                        time_difference,
+                    )
+                    LOGGER.debug(
+                        "Current time: %s | Alert start: %s | Alert end %s",
+                        current_time,
+                        start_time_utc,
+                        end_time_utc,
                     )
-                    LOGGER.debug("Current time: %s", current_time_str)
-                    alerts = {}
-                    for stored_alert in stored_alerts:
-                        event = stored_alert[0]
-                        alert_list = stored_alert[1]
-                        alerts[event] = []
-                        for alert in alert_list:
-                            end_time_str = alert["end_time_utc"]
-                            if parser.parse(end_time_str) >= parser.parse(
-                                current_time_str
-                            ):
-                                LOGGER.debug(
-                                    "getAlerts: Keeping %s because it does not expire until %s",
-                                    event,
-                                    end_time_str,
-                                )
-                                alerts[event].append(alert)
-                            else:
-                                LOGGER.debug(
-                                    "getAlerts: Removing %s because it expired at %s",
-                                    event,
-                                    end_time_str,
-                                )
             else:
-                LOGGER.error("No stored data available.")
-            break
-
-    alerts = OrderedDict(
-        sorted(
-            alerts.items(),
-            key=lambda item: (
-                max([x["severity"] for x in item[1]]),  # Max Severity
-                severity_mapping_words.get(item[0].split()[-1], 0),  # Words severity
-            ),
-            reverse=True,
-        )
-    )
-
-    # If the number of alerts exceeds the maximum defined constant, we truncate the alerts.
-    alerts = OrderedDict(list(alerts.items())[:MAX_ALERTS])
+                LOGGER.debug(
+                    "getAlerts: Skipping %s, missing start or end time.",
+                    event,
+                )
 
-    return alerts
+    # Sort the alerts by severity and truncate them to the maximum defined constant.
+    return sort_alerts(alerts)
 
 
 def sort_alerts(alerts):
@@ -694,17 +886,14 @@ def sort_alerts(alerts):
     Sorts and limits the alerts based on their severity and word severity.
     """
 
-    # Define mapping for converting common alert terminologies to a numeric severity scale
-    severity_mapping_words = {"Warning": 4, "Watch": 3, "Advisory": 2, "Statement": 1}
-
     # Sort the alerts first by their maximum severity, and then by their word severity
     sorted_alerts = OrderedDict(
         sorted(
             alerts.items(),
             key=lambda item: (
-                max([x["severity"] for x in item[1]]),  # Max Severity for the alert
-                severity_mapping_words.get(
-                    item[0].split()[-1], 0
+                max(x["severity"] for x in item[1]),  # Max Severity for the alert
+                SEVERITY_MAPPING_WORDS.get(
+                    item[0].rsplit(" ", 1)[-1], 0
                 ),  # Severity based on last word in the alert title
             ),
             reverse=True,  # Sort in descending order
@@ -729,17 +918,79 @@ def time_until(start_time_utc, current_time):
     # Determine the sign (used for formatting)
     sign = "-" if delta < timedelta(0) else ""
 
-    # Decompose the time difference into days, hours, and minutes
-    days, remainder = divmod(abs(delta.total_seconds()), 86400)
+    # Decompose the whole seconds of the time difference into days, hours, and minutes
+    days, remainder = divmod(abs(int(delta.total_seconds())), 86400)
     hours, remainder = divmod(remainder, 3600)
-    minutes, _ = divmod(remainder, 60)
+    minutes = remainder // 60
 
     # Return the time difference as a formatted string
-    return "{}{} days, {} hours, {} minutes".format(
-        sign, int(days), int(hours), int(minutes)
+    return "{}{} days, {} hours, {} minutes".format(sign, days, hours, minutes)
+
+
+def has_multiple(values):
+    """
+    Check whether an iterable holds more than one distinct value, stopping at the
+    first value that differs from the first one.
+    """
+    values = iter(values)
+    first = next(values, None)
+    return any(value != first for value in values)
+
+
+def has_multiple_instances(counties):
+    """
+    Check whether the counties of an alert belong to more than one instance of it,
+    meaning they differ in description or end time.
+    """
+    return has_multiple(county["description"] for county in counties) or has_multiple(
+        county["end_ts"] for county in counties
     )
 
 
+@functools.lru_cache(maxsize=256)
+def load_wav(path):
+    """
+    Load a WAV file into an AudioSegment already converted to 8000Hz mono, so all
+    the joining happens on the small format Asterisk plays. Results are cached, as
+    the sound files don't change while SkywarnPlus is running and AudioSegments
+    are immutable.
+    """
+    return convert_audio(AudioSegment.from_wav(path))
+
+
+def join_audio(segments):
+    """
+    Concatenate a list of AudioSegments, copying the sample data only once instead
+    of copying the growing result for every segment as repeated '+' does.
+    """
+    # Bring all segments to a common format, the same way AudioSegment's '+' would
+    frame_rate = max(segment.frame_rate for segment in segments)
+    channels = max(segment.channels for segment in segments)
+    sample_width = max(segment.sample_width for segment in segments)
+    segments = [
+        segment.set_frame_rate(frame_rate)
+        .set_channels(channels)
+        .set_sample_width(sample_width)
+        for segment in segments
+    ]
+
+    return segments[0]._spawn(b"".join(segment.raw_data for segment in segments))
+
+
+def write_silent_tailmessage():
+    """
+    Replace the tailmessage with 100ms of silence. The silent WAV is only rendered
+    the first time, after that it is simply copied into place.
+    """
+    if not os.path.isfile(SILENCE_FILE):
+        # Render to a temporary file and move it into place, so an interrupted export
+        # can't leave a truncated silence file behind
+        tmp_file = SILENCE_FILE + ".tmp"
+        convert_audio(SILENCE[100]).export(tmp_file, format="wav")
+        os.replace(tmp_file, SILENCE_FILE)
+    shutil.copyfile(SILENCE_FILE, TAILMESSAGE_FILE)
+
+
 def say_alerts(alerts):
     """
     Generate and broadcast severe weather alert sounds on Asterisk.
@@ -757,10 +1008,7 @@ def say_alerts(alerts):
     # Filter out alerts that are blocked based on configuration
     filtered_alerts_and_counties = {}
     for alert, county_codes in alert_names_and_counties.items():
-        if any(
-            fnmatch.fnmatch(alert, blocked_event)
-            for blocked_event in SAYALERT_BLOCKED_EVENTS
-        ):
+        if is_sayalert_blocked(alert):
             LOGGER.debug("sayAlert: blocking %s as per configuration", alert)
             continue
         filtered_alerts_and_counties[alert] = county_codes
@@ -776,78 +1024,58 @@ def say_alerts(alerts):
     state["last_sayalert"] = filtered_alerts_and_counties
     save_state(state)
 
+    # Read the settings used inside the alert loop once
+    with_multiples = config.get("Alerting", {}).get("WithMultiples", False)
+    alert_suffix = config.get("Alerting", {}).get("SayAlertSuffix", None)
+
     # Initialize the audio segments and paths
     alert_file = "{}/alert.wav".format(TMP_DIR)
-    word_space = AudioSegment.silent(duration=600)
-    sound_effect = AudioSegment.from_wav(
-        os.path.join(
-            SOUNDS_PATH,
-            "ALERTS",
-            "EFFECTS",
-            config.get("Alerting", {}).get("AlertSeperator", "Woodblock.wav"),
-        )
-    )
-    intro_effect = AudioSegment.from_wav(
-        os.path.join(
-            SOUNDS_PATH,
-            "ALERTS",
-            "EFFECTS",
-            config.get("Alerting", {}).get("AlertSound", "Duncecap.wav.wav"),
-        )
-    )
-    combined_sound = (
-        intro_effect
-        + word_space
-        + AudioSegment.from_wav(os.path.join(SOUNDS_PATH, "ALERTS", "SWP_148.wav"))
-    )
+    sound_effect = load_wav(ALERT_SEPARATOR_FILE)
+    intro_effect = load_wav(ALERT_SOUND_FILE)
+    # Collect the segments of the alert sound and join them once at the end
+    segments = [
+        intro_effect,
+        SILENCE[600],
+        load_wav(os.path.join(SOUNDS_PATH, "ALERTS", "SWP_148.wav")),
+    ]
 
     # Build the combined sound with alerts and county names
     alert_count = 0
     for alert, counties in alerts.items():
         if alert in filtered_alerts_and_counties:
             try:
-                descriptions = [county["description"] for county in counties]
-                end_times = [county["end_time_utc"] for county in counties]
-                index = ALERT_STRINGS.index(alert)
-                audio_file = AudioSegment.from_wav(
+                alert_index = ALERT_INDEX[alert]
+                audio_file = load_wav(
                     os.path.join(
-                        SOUNDS_PATH, "ALERTS", "SWP_{}.wav".format(ALERT_INDEXES[index])
+                        SOUNDS_PATH, "ALERTS", "SWP_{}.wav".format(alert_index)
                     )
                 )
-                combined_sound += sound_effect + audio_file
+                segments.extend((sound_effect, audio_file))
                 LOGGER.debug(
                     "sayAlert: Added %s (SWP_%s.wav) to alert sound",
                     alert,
-                    ALERT_INDEXES[index],
+                    alert_index,
                 )
-                if config["Alerting"]["WithMultiples"]:
-                    if len(set(descriptions)) > 1 or len(set(end_times)) > 1:
+                if with_multiples:
+                    if has_multiple_instances(counties):
                         LOGGER.debug(
                             "sayAlert: Found multiple unique instances of the alert %s",
                             alert,
                         )
-                        multiples_sound = AudioSegment.from_wav(
-                            os.path.join(SOUNDS_PATH, "ALERTS", "SWP_149.wav")
-                        )
-                        combined_sound += (
-                            AudioSegment.silent(duration=200) + multiples_sound
-                        )
+                        multiples_sound = load_wav(MULTIPLES_FILE)
+                        segments.extend((SILENCE[200], multiples_sound))
                 alert_count += 1
 
                 added_county_codes = set()
-                for county in counties:
-                    if counties.index(county) == 0:
-                        word_space = AudioSegment.silent(duration=600)
+                last_index = len(counties) - 1
+                for i, county in enumerate(counties):
+                    if i == 0:
+                        word_space = SILENCE[600]
                     else:
-                        word_space = AudioSegment.silent(duration=400)
+                        word_space = SILENCE[400]
                     county_code = county["county_code"]
-                    if (
-                        COUNTY_WAVS
-                        and county_code in COUNTY_CODES
-                        and county_code not in added_county_codes
-                    ):
-                        index = COUNTY_CODES.index(county_code)
-                        county_name_file = COUNTY_WAVS[index]
+                    county_name_file = COUNTY_WAV_MAP.get(county_code)
+                    if county_name_file and county_code not in added_county_codes:
                         LOGGER.debug(
                             "sayAlert: Adding %s ID %s to %s",
                             county_code,
@@ -855,9 +1083,10 @@ def say_alerts(alerts):
                             alert,
                         )
                         try:
-                            combined_sound += word_space + AudioSegment.from_wav(
+                            county_sound = load_wav(
                                 os.path.join(SOUNDS_PATH, county_name_file)
                             )
+                            segments.extend((word_space, county_sound))
                         except FileNotFoundError:
                             LOGGER.error(
                                 "sayAlert: County audio file not found: %s",
@@ -865,57 +1094,53 @@ def say_alerts(alerts):
                             )
                         added_county_codes.add(county_code)
 
-                        if counties.index(county) == len(counties) - 1:
-                            combined_sound += AudioSegment.silent(duration=600)
+                        if i == last_index:
+                            segments.append(SILENCE[600])
 
-            except ValueError:
+            except KeyError:
                 LOGGER.error("sayAlert: Alert not found: %s", alert)
             except FileNotFoundError:
                 LOGGER.error(
                     "sayAlert: Alert audio file not found: %s/ALERTS/SWP_%s.wav",
                     SOUNDS_PATH,
-                    ALERT_INDEXES[index],
+                    alert_index,
                 )
 
     if alert_count == 0:
         LOGGER.debug("sayAlert: All alerts were blocked, not broadcasting any alerts.")
         return
 
-    alert_suffix = config.get("Alerting", {}).get("SayAlertSuffix", None)
     if alert_suffix is not None:
-        suffix_silence = AudioSegment.silent(duration=600)
+        suffix_silence = SILENCE[600]
         LOGGER.debug("sayAlert: Adding alert suffix %s", alert_suffix)
         suffix_file = os.path.join(SOUNDS_PATH, alert_suffix)
-        suffix_sound = AudioSegment.from_wav(suffix_file)
-        combined_sound += suffix_silence + suffix_sound
+        suffix_sound = load_wav(suffix_file)
+        segments.extend((suffix_silence, suffix_sound))
 
     if AUDIO_DELAY > 0:
         LOGGER.debug("sayAlert: Prepending audio with %sms of silence", AUDIO_DELAY)
-        silence = AudioSegment.silent(duration=AUDIO_DELAY)
-        combined_sound = silence + combined_sound
+        silence = make_silence(AUDIO_DELAY)
+        segments.insert(0, silence)
+
+    combined_sound = join_audio(segments)
 
     LOGGER.debug("sayAlert: Exporting alert sound to %s", alert_file)
     converted_combined_sound = convert_audio(combined_sound)
     converted_combined_sound.export(alert_file, format="wav")
 
     LOGGER.debug("sayAlert: Replacing tailmessage with silence")
-    silence = AudioSegment.silent(duration=100)
-    converted_silence = convert_audio(silence)
-    converted_silence.export(TAILMESSAGE_FILE, format="wav")
+    write_silent_tailmessage()
 
     node_numbers = config.get("Asterisk", {}).get("Nodes", [])
+    alert_path = os.path.splitext(os.path.abspath(alert_file))[0]
+    command_groups = []
     for node_number in node_numbers:
         LOGGER.info("Broadcasting alert on node %s", node_number)
-        command = '/usr/sbin/asterisk -rx "rpt localplay {} {}"'.format(
-            node_number, os.path.splitext(os.path.abspath(alert_file))[0]
-        )
-        subprocess.run(command, shell=True)
+        command_groups.append(["rpt localplay {} {}".format(node_number, alert_path)])
+    run_asterisk_commands(command_groups, "/usr/sbin/asterisk")
 
-    # Get the duration of the alert_file
-    with contextlib.closing(wave.open(alert_file, "r")) as f:
-        frames = f.getnframes()
-        rate = f.getframerate()
-        duration = math.ceil(frames / float(rate))
+    # Get the duration of the alert sound we just exported
+    duration = math.ceil(converted_combined_sound.duration_seconds)
 
     wait_time = duration + 10
 
@@ -931,10 +1156,11 @@ def say_allclear():
     Generate and broadcast 'all clear' message on Asterisk.
     """
 
-    # Load current state and clear the last_sayalert list
+    # Load current state and clear the last_sayalert list, saving only if it wasn't already clear
     state = load_state()
+    state_dirty = bool(state["last_sayalert"])
     state["last_sayalert"] = []
-    save_state(state)
+    save_state(state, state_dirty)
 
     # Define file paths for the sounds
     all_clear_sound_file = os.path.join(
@@ -946,11 +1172,11 @@ def say_allclear():
     swp_147_file = os.path.join(SOUNDS_PATH, "ALERTS", "SWP_147.wav")
 
     # Load sound files into AudioSegment objects
-    all_clear_sound = AudioSegment.from_wav(all_clear_sound_file)
-    swp_147_sound = AudioSegment.from_wav(swp_147_file)
+    all_clear_sound = load_wav(all_clear_sound_file)
+    swp_147_sound = load_wav(swp_147_file)
 
-    # Generate silence for spacing between sounds
-    silence = AudioSegment.silent(duration=600)  # 600 ms of silence
+    # Use 600 ms of silence for spacing between sounds
+    silence = SILENCE[600]
 
     # Combine the "all clear" sound and SWP_147 sound with the configured silence between them
     combined_sound = all_clear_sound + silence + swp_147_sound
@@ -958,19 +1184,17 @@ def say_allclear():
     # Add a delay before the sound if configured
     if AUDIO_DELAY > 0:
         LOGGER.debug("sayAllClear: Prepending audio with %sms of silence", AUDIO_DELAY)
-        delay_silence = AudioSegment.silent(duration=AUDIO_DELAY)
+        delay_silence = make_silence(AUDIO_DELAY)
         combined_sound = delay_silence + combined_sound
 
     # Append a suffix to the sound if configured
     if config.get("Alerting", {}).get("SayAllClearSuffix", None) is not None:
-        suffix_silence = AudioSegment.silent(
-            duration=600
-        )  # 600ms silence before the suffix
+        suffix_silence = SILENCE[600]  # 600ms silence before the suffix
         suffix_file = os.path.join(
             SOUNDS_PATH, config.get("Alerting", {}).get("SayAllClearSuffix")
         )
         LOGGER.debug("sayAllClear: Adding all clear suffix %s", suffix_file)
-        suffix_sound = AudioSegment.from_wav(suffix_file)
+        suffix_sound = load_wav(suffix_file)
         combined_sound += (
             suffix_silence + suffix_sound
         )  # Append the silence and then the suffix to the combined sound
@@ -984,12 +1208,14 @@ def say_allclear():
 
     # Play the "all clear" sound on the configured Asterisk nodes
     node_numbers = config.get("Asterisk", {}).get("Nodes", [])
+    all_clear_path = os.path.splitext(os.path.abspath(all_clear_file))[0]
+    command_groups = []
     for node_number in node_numbers:
         LOGGER.info("Broadcasting all clear message on node %s", node_number)
-        command = '/usr/sbin/asterisk -rx "rpt localplay {} {}"'.format(
-            node_number, os.path.splitext(os.path.abspath(all_clear_file))[0]
+        command_groups.append(
+            ["rpt localplay {} {}".format(node_number, all_clear_path)]
         )
-        subprocess.run(command, shell=True)
+    run_asterisk_commands(command_groups, "/usr/sbin/asterisk")
 
 
 def build_tailmessage(alerts):
@@ -1001,6 +1227,9 @@ def build_tailmessage(alerts):
     # Determine whether the user has enabled county identifiers
     county_identifiers = config.get("Tailmessage", {}).get("TailmessageCounties", False)
 
+    # Determine whether multiple instances of an alert should be announced
+    with_multiples = config.get("Alerting", {}).get("WithMultiples", False)
+
     # Extract only the alert names from the OrderedDict keys
     alert_names = [alert for alert in alerts.keys()]
 
@@ -1010,80 +1239,57 @@ def build_tailmessage(alerts):
     # If alerts is empty
     if not alerts:
         LOGGER.debug("buildTailMessage: No alerts, creating silent tailmessage")
-        silence = AudioSegment.silent(duration=100)
-        converted_silence = convert_audio(silence)
-        converted_silence.export(TAILMESSAGE_FILE, format="wav")
+        write_silent_tailmessage()
         return
 
-    combined_sound = AudioSegment.empty()
-    sound_effect = AudioSegment.from_wav(
-        os.path.join(
-            SOUNDS_PATH,
-            "ALERTS",
-            "EFFECTS",
-            config.get("Alerting", {}).get("AlertSeperator", "Woodblock.wav"),
-        )
-    )
+    # Collect the segments of the tailmessage and join them once at the end
+    segments = []
+    sound_effect = load_wav(ALERT_SEPARATOR_FILE)
 
     for (
         alert,
         counties,
     ) in alerts.items():  # Now we loop over both alert name and its associated counties
         added_counties = set()
-        if any(
-            fnmatch.fnmatch(alert, blocked_event)
-            for blocked_event in TAILMESSAGE_BLOCKED_EVENTS
-        ):
+        if is_tailmessage_blocked(alert):
             LOGGER.debug(
                 "buildTailMessage: Alert blocked by TailmessageBlockedEvents: %s", alert
             )
             continue
 
         try:
-            index = ALERT_STRINGS.index(alert)
-            audio_file = AudioSegment.from_wav(
-                os.path.join(
-                    SOUNDS_PATH, "ALERTS", "SWP_{}.wav".format(ALERT_INDEXES[index])
-                )
+            alert_index = ALERT_INDEX[alert]
+            audio_file = load_wav(
+                os.path.join(SOUNDS_PATH, "ALERTS", "SWP_{}.wav".format(alert_index))
             )
-            combined_sound += sound_effect + audio_file
+            segments.extend((sound_effect, audio_file))
             LOGGER.debug(
                 "buildTailMessage: Added %s (SWP_%s.wav) to tailmessage",
                 alert,
-                ALERT_INDEXES[index],
+                alert_index,
             )
 
-            descriptions = [county["description"] for county in counties]
-            end_times = [county["end_time_utc"] for county in counties]
-            if config["Alerting"]["WithMultiples"]:
-                if len(set(descriptions)) > 1 or len(set(end_times)) > 1:
+            if with_multiples:
+                if has_multiple_instances(counties):
                     LOGGER.debug(
                         "buildTailMessage: Found multiple unique instances of the alert %s",
                         alert,
                     )
-                    multiples_sound = AudioSegment.from_wav(
-                        os.path.join(SOUNDS_PATH, "ALERTS", "SWP_149.wav")
-                    )
-                    combined_sound += (
-                        AudioSegment.silent(duration=200) + multiples_sound
-                    )
+                    multiples_sound = load_wav(MULTIPLES_FILE)
+                    segments.extend((SILENCE[200], multiples_sound))
 
             # Add county names if they exist
             if county_identifiers:
-                for county in counties:
+                last_index = len(counties) - 1
+                for i, county in enumerate(counties):
                     # if its the first county, word_space is 600ms of silence. else it is 400ms
-                    if counties.index(county) == 0:
-                        word_space = AudioSegment.silent(duration=600)
+                    if i == 0:
+                        word_space = SILENCE[600]
                     else:
-                        word_space = AudioSegment.silent(duration=400)
+                        word_space = SILENCE[400]
                     county_code = county["county_code"]
-                    if (
-                        COUNTY_WAVS
-                        and county_code in COUNTY_CODES
-                        and county_code not in added_counties
-                    ):
-                        index = COUNTY_CODES.index(county_code)
-                        county_name_file = COUNTY_WAVS[index]
+                    county_name_file = COUNTY_WAV_MAP.get(county_code)
+                    if county_name_file and county_code not in added_counties:
                         LOGGER.debug(
                             "buildTailMessage: Adding %s ID %s to %s",
                             county_code,
@@ -1091,12 +1297,13 @@ def build_tailmessage(alerts):
                             alert,
                         )
                         try:
-                            combined_sound += word_space + AudioSegment.from_wav(
+                            county_sound = load_wav(
                                 os.path.join(SOUNDS_PATH, county_name_file)
                             )
+                            segments.extend((word_space, county_sound))
                             # if this is the last county name, add 600ms of silence after the county name
-                            if counties.index(county) == len(counties) - 1:
-                                combined_sound += AudioSegment.silent(duration=600)
+                            if i == last_index:
+                                segments.append(SILENCE[600])
                             added_counties.add(county_code)
                         except FileNotFoundError:
                             LOGGER.error(
@@ -1104,35 +1311,37 @@ def build_tailmessage(alerts):
                                 os.path.join(SOUNDS_PATH, county_name_file),
                             )
 
-        except ValueError:
+        except KeyError:
             LOGGER.error("Alert not found: %s", alert)
         except FileNotFoundError:
             LOGGER.error(
                 "buildTailMessage: Audio file not found: %s/ALERTS/SWP_%s.wav",
                 SOUNDS_PATH,
-                ALERT_INDEXES[index],
+                alert_index,
             )
 
-    if combined_sound.empty():
+    if not segments:
         LOGGER.debug(
             "buildTailMessage: All alerts were blocked, creating silent tailmessage"
         )
-        combined_sound = AudioSegment.silent(duration=100)
+        segments.append(SILENCE[100])
     elif tailmessage_suffix is not None:
-        suffix_silence = AudioSegment.silent(duration=1000)
+        suffix_silence = SILENCE[1000]
         LOGGER.debug(
             "buildTailMessage: Adding tailmessage suffix %s", tailmessage_suffix
         )
         suffix_file = os.path.join(SOUNDS_PATH, tailmessage_suffix)
-        suffix_sound = AudioSegment.from_wav(suffix_file)
-        combined_sound += suffix_silence + suffix_sound
+        suffix_sound = load_wav(suffix_file)
+        segments.extend((suffix_silence, suffix_sound))
 
     if AUDIO_DELAY > 0:
         LOGGER.debug(
             "buildTailMessage: Prepending audio with %sms of silence", AUDIO_DELAY
         )
-        silence = AudioSegment.silent(duration=AUDIO_DELAY)
-        combined_sound = silence + combined_sound
+        silence = make_silence(AUDIO_DELAY)
+        segments.insert(0, silence)
+
+    combined_sound = join_audio(segments)
 
     converted_combined_sound = convert_audio(combined_sound)
     LOGGER.info("Built new tailmessage")
@@ -1203,11 +1412,15 @@ def alert_script(alerts):
                         LOGGER.info("Executing Active BASH Command: %s", cmd)
                         subprocess.run(cmd, shell=True)
                 elif command["Type"].upper() == "DTMF":
+                    command_groups = []
                     for node in command["Nodes"]:
+                        dtmf_cmds = []
                         for cmd in command["Commands"]:
-                            dtmf_cmd = 'asterisk -rx "rpt fun {} {}"'.format(node, cmd)
+                            dtmf_cmd = "rpt fun {} {}".format(node, cmd)
                             LOGGER.info("Executing Active DTMF Command: %s", dtmf_cmd)
-                            subprocess.run(dtmf_cmd, shell=True)
+                            dtmf_cmds.append(dtmf_cmd)
+                        command_groups.append(dtmf_cmds)
+                    run_asterisk_commands(command_groups)
 
     # Check for transition from non-zero to zero active alerts and execute InactiveCommands
     if previous_active_count > 0 and current_active_count == 0:
@@ -1219,11 +1432,15 @@ def alert_script(alerts):
                         LOGGER.info("Executing Inactive BASH Command: %s", cmd)
                         subprocess.run(cmd, shell=True)
                 elif command["Type"].upper() == "DTMF":
+                    command_groups = []
                     for node in command["Nodes"]:
+                        dtmf_cmds = []
                         for cmd in command["Commands"]:
-                            dtmf_cmd = 'asterisk -rx "rpt fun {} {}"'.format(node, cmd)
+                            dtmf_cmd = "rpt fun {} {}".format(node, cmd)
                             LOGGER.info("Executing Inactive DTMF Command: %s", dtmf_cmd)
-                            subprocess.run(dtmf_cmd, shell=True)
+                            dtmf_cmds.append(dtmf_cmd)
+                        command_groups.append(dtmf_cmds)
+                    run_asterisk_commands(command_groups)
 
     # Fetch Mappings from AlertScript configuration
     mappings = alertScript_config.get("Mappings", [])
@@ -1231,8 +1448,13 @@ def alert_script(alerts):
         mappings = []
     LOGGER.debug("Mappings: %s", mappings)
 
+    # Compile the triggers of each mapping once, for both new and cleared alerts
+    trigger_matchers = [
+        compile_event_patterns(mapping.get("Triggers", [])) for mapping in mappings
+    ]
+
     # Process each mapping for new alerts and issue a warning for wildcard clear commands
-    for mapping in mappings:
+    for mapping, matches_trigger in zip(mappings, trigger_matchers):
         if "*" in mapping.get("Triggers", []) and mapping.get("ClearCommands"):
             LOGGER.warning(
                 "Using ClearCommands with wildcard-based mappings ('*') might not behave as expected for all alert clearances."
@@ -1244,11 +1466,7 @@ def alert_script(alerts):
         nodes = mapping.get("Nodes", [])
         match_type = mapping.get("Match", "ANY").upper()
 
-        matched_alerts = [
-            alert
-            for alert in new_alerts
-            if any(fnmatch.fnmatch(alert, trigger) for trigger in triggers)
-        ]
+        matched_alerts = [alert for alert in new_alerts if matches_trigger(alert)]
         LOGGER.debug("Matched alerts for mapping: %s", matched_alerts)
 
         # Check if new alerts matched the triggers as per the match type
@@ -1267,25 +1485,27 @@ def alert_script(alerts):
                         LOGGER.info("AlertScript: Executing BASH command: %s", cmd)
                         subprocess.run(cmd, shell=True)
                 elif mapping.get("Type") == "DTMF":
+                    command_groups = []
                     for node in nodes:
+                        dtmf_cmds = []
                         for cmd in commands:
-                            dtmf_cmd = 'asterisk -rx "rpt fun {} {}"'.format(node, cmd)
+                            dtmf_cmd = "rpt fun {} {}".format(node, cmd)
                             LOGGER.info(
                                 "AlertScript: Executing DTMF command: %s", dtmf_cmd
                             )
-                            subprocess.run(dtmf_cmd, shell=True)
+                            dtmf_cmds.append(dtmf_cmd)
+                        command_groups.append(dtmf_cmds)
+                    run_asterisk_commands(command_groups)
 
     # Process each mapping for cleared alerts
-    for mapping in mappings:
+    for mapping, matches_trigger in zip(mappings, trigger_matchers):
         LOGGER.debug("Processing clear commands for mapping: %s", mapping)
         clear_commands = mapping.get("ClearCommands", [])
         triggers = mapping.get("Triggers", [])
         match_type = mapping.get("Match", "ANY").upper()
 
         matched_cleared_alerts = [
-            alert
-            for alert in cleared_alerts
-            if any(fnmatch.fnmatch(alert, trigger) for trigger in triggers)
+            alert for alert in cleared_alerts if matches_trigger(alert)
         ]
         LOGGER.debug("Matched cleared alerts for mapping: %s", matched_cleared_alerts)
 
@@ -1299,19 +1519,26 @@ def alert_script(alerts):
                     LOGGER.info("AlertScript: Executing BASH ClearCommand: %s", cmd)
                     subprocess.run(cmd, shell=True)
                 elif mapping.get("Type") == "DTMF":
+                    command_groups = []
                     for node in mapping.get("Nodes", []):
-                        dtmf_cmd = 'asterisk -rx "rpt fun {} {}"'.format(node, cmd)
+                        dtmf_cmd = "rpt fun {} {}".format(node, cmd)
                         LOGGER.info(
                             "AlertScript: Executing DTMF ClearCommand: %s", dtmf_cmd
                         )
-                        subprocess.run(dtmf_cmd, shell=True)
+                        command_groups.append([dtmf_cmd])
+                    run_asterisk_commands(command_groups)
+
+    # Only save the state if the active or processed alerts have changed
+    state_dirty = active_alerts != alert_names or processed_alerts != set(
+        state["alertscript_alerts"]
+    )
 
     # Update the state with the alerts processed in this run
     state["alertscript_alerts"] = list(
         processed_alerts
     )  # Convert back to list for JSON serialization
     LOGGER.debug("Saving state with processed alerts: %s", state["alertscript_alerts"])
-    save_state(state)
+    save_state(state, state_dirty)
     LOGGER.debug("Alert script execution completed.")
 
 
@@ -1325,9 +1552,6 @@ def send_pushover(message, title=None, priority=0):
     user_key = pushover_config.get("UserKey")
     token = pushover_config.get("APIToken")
 
-    # Remove newline from the end of the message
-    message = message.rstrip("\n")
-
     url = "https://api.pushover.net/1/messages.json"
     payload = {
         "token": token,
@@ -1337,17 +1561,61 @@ def send_pushover(message, title=None, priority=0):
         "priority": priority,
     }
 
-    response = requests.post(url, data=payload)
+    # Use the shared session so the connection is reused, and don't wait forever on it
+    try:
+        response = SESSION.post(url, data=payload, timeout=10)
+    except requests.exceptions.RequestException as e:
+        LOGGER.error("Failed to send Pushover notification: %s", e)
+        return
 
     if response.status_code != 200:
         LOGGER.error("Failed to send Pushover notification: %s", response.text)
 
 
+def run_asterisk_command(command, asterisk="asterisk"):
+    """
+    Run a command on the Asterisk CLI. The command is passed straight to asterisk
+    as an argument, without starting a shell to parse it.
+    """
+    try:
+        subprocess.run([asterisk, "-rx", command])
+    except OSError as e:
+        LOGGER.error("Failed to run Asterisk command '%s': %s", command, e)
+
+
+def run_asterisk_commands(command_groups, asterisk="asterisk"):
+    """
+    Run groups of Asterisk CLI commands, usually one group per node. The groups run
+    concurrently, while the commands within a group still run one after another.
+    """
+    command_groups = [commands for commands in command_groups if commands]
+
+    def run_group(commands):
+        for command in commands:
+            run_asterisk_command(command, asterisk)
+
+    # No need for threads when there is only one group to run
+    if len(command_groups) <= 1:
+        for commands in command_groups:
+            run_group(commands)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(8, len(command_groups))) as executor:
+        list(executor.map(run_group, command_groups))
+
+
 def convert_audio(audio):
     """
-    Convert audio file to 8000Hz mono for compatibility with Asterisk.
+    Convert audio file to 8000Hz mono 16-bit for compatibility with Asterisk.
+    Audio that is already in that format is returned as is.
     """
-    return audio.set_frame_rate(8000).set_channels(1)
+    if audio.frame_rate != 8000:
+        audio = audio.set_frame_rate(8000)
+    if audio.channels != 1:
+        audio = audio.set_channels(1)
+    if audio.sample_width != 2:
+        audio = audio.set_sample_width(2)
+    return audio
 
 
 def change_ct_id_helper(
@@ -1356,10 +1624,11 @@ def change_ct_id_helper(
     auto_change_enabled,
     alert_type,
     pushover_debug,
-    pushover_message,
+    pushover_parts,
 ):
     """
     Check whether the CT or ID needs to be changed, performs the change, and logs the process.
+    Any Pushover debug lines are appended to pushover_parts.
     """
     if auto_change_enabled:
         LOGGER.debug(
@@ -1369,24 +1638,21 @@ def change_ct_id_helper(
             specified_alerts,
         )
 
-        # Extract only the alert names from the OrderedDict keys
-        alert_names = [alert for alert in alerts.keys()]
-
-        # Check if any alert matches specified_alerts
-        # Here we replace set intersection with a list comprehension
-        intersecting_alerts = [
-            alert for alert in alert_names if alert in specified_alerts
-        ]
+        # Find the first alert, in alert order, that requires a change
+        specified_alerts = frozenset(specified_alerts)
+        intersecting_alert = next(
+            (alert for alert in alerts if alert in specified_alerts), None
+        )
 
-        if intersecting_alerts:
-            for alert in intersecting_alerts:
-                LOGGER.debug("Alert %s requires a %s change", alert, alert_type)
-                if (
-                    change_ct("WX") if alert_type == "CT" else change_id("WX")
-                ):  # If the CT/ID was actually changed
-                    if pushover_debug:
-                        pushover_message += "Changed {} to WX\n".format(alert_type)
-                break
+        if intersecting_alert is not None:
+            LOGGER.debug(
+                "Alert %s requires a %s change", intersecting_alert, alert_type
+            )
+            if (
+                change_ct("WX") if alert_type == "CT" else change_id("WX")
+            ):  # If the CT/ID was actually changed
+                if pushover_debug:
+                    pushover_parts.append("Changed {} to WX".format(alert_type))
         else:  # No alerts require a CT/ID change, revert back to normal
             LOGGER.debug(
                 "No alerts require a %s change, reverting to normal.", alert_type
@@ -1395,11 +1661,26 @@ def change_ct_id_helper(
                 change_ct("NORMAL") if alert_type == "CT" else change_id("NORMAL")
             ):  # If the CT/ID was actually changed
                 if pushover_debug:
-                    pushover_message += "Changed {} to NORMAL\n".format(alert_type)
+                    pushover_parts.append("Changed {} to NORMAL".format(alert_type))
     else:
         LOGGER.debug("%s auto change is not enabled", alert_type)
 
 
+def copy_if_different(src_file, dest_file):
+    """
+    Copy src_file to dest_file, unless dest_file already has the same contents.
+    Returns True if the file was copied.
+    """
+    try:
+        if filecmp.cmp(src_file, dest_file, shallow=False):
+            return False
+    except OSError:
+        # The destination doesn't exist yet
+        pass
+    shutil.copyfile(src_file, dest_file)
+    return True
+
+
 def change_ct(mode):
     """
     Dynamically changes courtesy tones based on the specified operational mode ('NORMAL' or 'WX') and the detailed configuration provided.
@@ -1436,14 +1717,18 @@ def change_ct(mode):
             continue
 
         try:
-            shutil.copyfile(src_file, dest_file)
-            LOGGER.info(
-                "ChangeCT: Updated %s to %s mode with tone %s",
-                ct_key,
-                mode,
-                target_tone,
-            )
-            changed = True
+            if copy_if_different(src_file, dest_file):
+                LOGGER.info(
+                    "ChangeCT: Updated %s to %s mode with tone %s",
+                    ct_key,
+                    mode,
+                    target_tone,
+                )
+                changed = True
+            else:
+                LOGGER.debug(
+                    "ChangeCT: %s already has tone %s, not copying", ct_key, target_tone
+                )
         except Exception as e:
             LOGGER.error("ChangeCT: Failed to update %s: %s", ct_key, str(e))
 
@@ -1509,7 +1794,8 @@ def change_id(id):
     try:
         LOGGER.info("Changing to %s ID", id)
         LOGGER.debug("changeID: Copying %s to %s", src_file, dest_file)
-        shutil.copyfile(src_file, dest_file)
+        if not copy_if_different(src_file, dest_file):
+            LOGGER.debug("changeID: %s already matches %s", dest_file, src_file)
     except Exception as e:
         LOGGER.error(
             "changeID: Failed to copy file from %s to %s: %s", src_file, dest_file, e
@@ -1547,6 +1833,27 @@ def generate_title_string(alerts, county_data):
     return alert_titles_with_counties
 
 
+def write_if_changed(path, content):
+    """
+    Write content to a text file, unless the file already holds exactly that content.
+    The file is replaced atomically, so readers never see it partially written.
+    Returns True if the file was written.
+    """
+    try:
+        with open(path, "r") as file:
+            if file.read() == content:
+                return False
+    except (IOError, UnicodeDecodeError):
+        # The file doesn't exist yet or can't be read, just write it
+        pass
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as file:
+        file.write(content)
+    os.replace(tmp_path, path)
+    return True
+
+
 def supermon_back_compat(alerts, county_data):
     """
     Write alerts to a file for backwards compatibility with Supermon.
@@ -1564,12 +1871,14 @@ def supermon_back_compat(alerts, county_data):
 
         # Construct alert titles with county names using generate_title_string function
         alert_titles_with_counties = generate_title_string(alerts, county_data)
+        warnings_text = "<br>".join(alert_titles_with_counties)
 
         # Check write permissions before writing to the file
         if os.access("/tmp/AUTOSKY", os.W_OK):
-            with open("/tmp/AUTOSKY/warnings.txt", "w") as file:
-                file.write("<br>".join(alert_titles_with_counties))
-            LOGGER.debug("Successfully wrote alerts to /tmp/AUTOSKY/warnings.txt")
+            if write_if_changed("/tmp/AUTOSKY/warnings.txt", warnings_text):
+                LOGGER.debug("Successfully wrote alerts to /tmp/AUTOSKY/warnings.txt")
+            else:
+                LOGGER.debug("/tmp/AUTOSKY/warnings.txt is already up to date")
         else:
             LOGGER.error("No write permission for /tmp/AUTOSKY")
 
@@ -1582,11 +1891,12 @@ def supermon_back_compat(alerts, county_data):
 
         # Check write permissions before writing to the file
         if os.access("/var/www/html/AUTOSKY", os.W_OK):
-            with open("/var/www/html/AUTOSKY/warnings.txt", "w") as file:
-                file.write("<br>".join(alert_titles_with_counties))
-            LOGGER.debug(
-                "Successfully wrote alerts to /var/www/html/AUTOSKY/warnings.txt"
-            )
+            if write_if_changed("/var/www/html/AUTOSKY/warnings.txt", warnings_text):
+                LOGGER.debug(
+                    "Successfully wrote alerts to /var/www/html/AUTOSKY/warnings.txt"
+                )
+            else:
+                LOGGER.debug("/var/www/html/AUTOSKY/warnings.txt is already up to date")
         else:
             LOGGER.error("No write permission for /var/www/html/AUTOSKY")
 
@@ -1840,6 +2150,10 @@ def ast_var_update():
     LOGGER.debug("ast_var_update: Function completed")
 
 
+# Translation table that strips stray braces and quotes from county codes in a single pass
+COUNTY_CODE_STRIP = str.maketrans("", "", '{}"')
+
+
 def detect_county_changes(old_alerts, new_alerts):
     """
     Detect if any counties have been added to or removed from an alert and return the alerts
@@ -1851,20 +2165,20 @@ def detect_county_changes(old_alerts, new_alerts):
     for alert_name, alert_info in new_alerts.items():
         if alert_name not in old_alerts:
             continue
-        old_alert_info = old_alerts.get(alert_name, [])
-        old_county_codes = {info["county_code"] for info in old_alert_info}
+        old_county_codes = {info["county_code"] for info in old_alerts[alert_name]}
         new_county_codes = {info["county_code"] for info in alert_info}
 
-        added_counties = new_county_codes - old_county_codes
-        removed_counties = old_county_codes - new_county_codes
+        # Nothing to do if the alert still covers the same counties
+        if new_county_codes == old_county_codes:
+            continue
 
         added_counties = {
-            code.replace("{", "").replace("}", "").replace('"', "")
-            for code in added_counties
+            code.translate(COUNTY_CODE_STRIP)
+            for code in new_county_codes - old_county_codes
         }
         removed_counties = {
-            code.replace("{", "").replace("}", "").replace('"', "")
-            for code in removed_counties
+            code.translate(COUNTY_CODE_STRIP)
+            for code in old_county_codes - new_county_codes
         }
 
         if added_counties or removed_counties:
@@ -1878,26 +2192,21 @@ def detect_county_changes(old_alerts, new_alerts):
     return alerts_with_changed_counties, changes_detected
 
 
+# Matches a "| County | Code |" table row in the county codes markdown file
+COUNTY_ROW_RE = re.compile(
+    r"^\|[ \t]*([^|\n]+?)[ \t]*\|[ \t]*([A-Z0-9]+)[ \t]*\|[ \t]*$", re.MULTILINE
+)
+
+
 def load_county_names(md_file):
     """
     Load county names from separate markdown tables so that county codes can be replaced with county names.
     """
     with open(md_file, "r") as f:
-        lines = f.readlines()
-
-    county_data = {}
-    in_table = False
-    for line in lines:
-        if line.startswith("| County |"):
-            in_table = True
-            continue  # Skip the header
-        elif not in_table or line.strip() == "" or line.startswith("##"):
-            continue
-        else:
-            name, code = [s.strip() for s in line.split("|")[1:-1]]
-            county_data[code] = name
+        text = f.read()
 
-    return county_data
+    # Each table row is "| name | code |", the header and separator rows don't match
+    return {code: name for name, code in COUNTY_ROW_RE.findall(text)}
 
 
 def replace_with_county_name(county_code, county_data):
@@ -1907,6 +2216,18 @@ def replace_with_county_name(county_code, county_data):
     return county_data.get(county_code, county_code)
 
 
+def format_county_names(county_codes, county_data):
+    """
+    Turn county codes into a sorted, comma separated string of the unique county names.
+    Codes without a known name are kept as is, like replace_with_county_name does.
+    """
+    # Look the codes up directly, this is the same lookup without a function call per code
+    county_name = county_data.get
+    return ", ".join(
+        sorted({county_name(county_code, county_code) for county_code in county_codes})
+    )
+
+
 def main():
     """
     The main function that orchestrates the entire process of fetching and
@@ -1963,96 +2284,86 @@ def main():
     # Fetch new alert data
     alerts = get_alerts(COUNTY_CODES)
 
-    # Placeholder for constructing a pushover message
-    pushover_message = ""
+    # Collect the lines of the pushover message, they are joined once when it is sent
+    pushover_parts = []
 
     # Update HamVoIP Asterisk channel variables
     if supermon_compat_enabled:
         supermon_back_compat(alerts, county_data)
         ast_var_update()
 
-    # Determine which alerts have been added since the last check
-    added_alerts = [alert for alert in alerts if alert not in last_alerts]
+    # Determine which alerts have been added since the last check, in their sorted order
+    added = alerts.keys() - last_alerts.keys()
+    added_alerts = [alert for alert in alerts if alert in added] if added else []
     for alert in added_alerts:
-        counties = sorted(
-            set(
-                replace_with_county_name(x["county_code"], county_data)
-                for x in alerts[alert]
-            )
+        counties = alerts[alert]
+        counties_str = "[{}]".format(
+            format_county_names((x["county_code"] for x in counties), county_data)
         )
-        counties_str = "[" + ", ".join(counties) + "]"
-        LOGGER.info("Added: {} for {}".format(alert, counties_str))
-        pushover_message += "Added: {} for {}\n".format(alert, counties_str)
-
-    # Determine which alerts have been removed since the last check
-    removed_alerts = [alert for alert in last_alerts if alert not in alerts]
+        log_msg = "Added: {} for {}".format(alert, counties_str)
+        LOGGER.info(log_msg)
+        pushover_parts.append(log_msg)
+
+    # Determine which alerts have been removed since the last check, in their sorted order
+    removed = last_alerts.keys() - alerts.keys()
+    removed_alerts = (
+        [alert for alert in last_alerts if alert in removed] if removed else []
+    )
     for alert in removed_alerts:
-        counties = sorted(
-            set(
-                replace_with_county_name(x["county_code"], county_data)
-                for x in last_alerts[alert]
-            )
+        counties = last_alerts[alert]
+        counties_str = "[{}]".format(
+            format_county_names((x["county_code"] for x in counties), county_data)
         )
-        counties_str = "[" + ", ".join(counties) + "]"
-        LOGGER.info("Removed: {} for {}".format(alert, counties_str))
-        pushover_message += "Removed: {} for {}\n".format(alert, counties_str)
+        log_msg = "Removed: {} for {}".format(alert, counties_str)
+        LOGGER.info(log_msg)
+        pushover_parts.append(log_msg)
 
     # Placeholder for storing alerts with changed county codes
     changed_alerts = {}
 
-    # If the list of alerts is not empty
-    if alerts:
+    # If the list of alerts is not empty and differs from the last check
+    if alerts and alerts != last_alerts:
         # Compare old and new alerts to detect changes in affected counties
         changed_alerts, changes_details = detect_county_changes(last_alerts, alerts)
 
         for alert, details in changes_details.items():
-            old_counties = sorted(
-                set(
-                    replace_with_county_name(county, county_data)
-                    for county in details["old"]
-                )
+            old_counties_str = "[{}]".format(
+                format_county_names(details["old"], county_data)
             )
-            old_counties_str = "[" + ", ".join(old_counties) + "]"
 
             added_msg = ""
             if details["added"]:
-                added_counties = sorted(
-                    set(
-                        replace_with_county_name(county, county_data)
-                        for county in details["added"]
-                    )
+                added_counties_str = "[{}]".format(
+                    format_county_names(details["added"], county_data)
                 )
-                added_counties_str = "[" + ", ".join(added_counties) + "]"
                 added_msg = "is now also affecting {}".format(added_counties_str)
 
             removed_msg = ""
             if details["removed"]:
-                removed_counties = sorted(
-                    set(
-                        replace_with_county_name(county, county_data)
-                        for county in details["removed"]
-                    )
+                removed_counties_str = "[{}]".format(
+                    format_county_names(details["removed"], county_data)
                 )
-                removed_counties_str = "[" + ", ".join(removed_counties) + "]"
                 removed_msg = "is no longer affecting {}".format(removed_counties_str)
 
-            # Combining the log messages
-            combined_msg_parts = ["Changed: {} for {}".format(alert, old_counties_str)]
-            if added_msg:
-                combined_msg_parts.append(added_msg)
-            if removed_msg:
-                if (
-                    added_msg
-                ):  # if there's an 'added' message, then use 'and' to combine with 'removed' message
-                    combined_msg_parts.append("and")
-                combined_msg_parts.append(removed_msg)
-
-            log_msg = " ".join(combined_msg_parts)
+            # Combining the log messages, using 'and' when counties were both added and removed
+            if added_msg and removed_msg:
+                log_msg = "Changed: {} for {} {} and {}".format(
+                    alert, old_counties_str, added_msg, removed_msg
+                )
+            elif added_msg or removed_msg:
+                log_msg = "Changed: {} for {} {}".format(
+                    alert, old_counties_str, added_msg or removed_msg
+                )
+            else:
+                log_msg = "Changed: {} for {}".format(alert, old_counties_str)
             LOGGER.info(log_msg)
-            pushover_message += log_msg + "\n"
+            pushover_parts.append(log_msg)
+
+    # Whether any alerts have been added or removed, checked once for both branches below
+    added_or_removed = bool(added or removed)
 
     # Process changes in alerts
-    if added_alerts or removed_alerts or changed_alerts:
+    if added_or_removed or changed_alerts:
         # Save the data
         state["last_alerts"] = alerts
         save_state(state)
@@ -2064,10 +2375,10 @@ def main():
             if say_all_clear_enabled:
                 say_allclear()
             # Add "Alerts Cleared" to pushover message
-            pushover_message += "Alerts Cleared\n"
+            pushover_parts.append("Alerts Cleared")
 
         # If alerts have been added, removed
-        if added_alerts or removed_alerts:
+        if added_or_removed:
             # Push alert titles to Supermon if enabled
             # if supermon_compat_enabled:
             #     supermon_back_compat(alerts)
@@ -2079,7 +2390,7 @@ def main():
                 enable_ct_auto_change,
                 "CT",
                 pushover_debug,
-                pushover_message,
+                pushover_parts,
             )
             change_ct_id_helper(
                 alerts,
@@ -2087,7 +2398,7 @@ def main():
                 enable_id_auto_change,
                 "ID",
                 pushover_debug,
-                pushover_message,
+                pushover_parts,
             )
 
             # Call alert_script if enabled
@@ -2102,16 +2413,24 @@ def main():
 
                 # Otherwise, only say newly added alerts
                 else:
-                    alerts_to_say = {alert: alerts[alert] for alert in added_alerts}
                     # If County IDs have been set up and there is more than one county code, then also say alerts with county changes
                     # Only if enabled
-                    if (
+                    say_changed = (
                         changed_alerts
                         and say_alerts_changed
-                        and COUNTY_WAVS
-                        and len(COUNTY_CODES) > 1
-                    ):
-                        alerts_to_say.update(changed_alerts)
+                        and ANNOUNCE_COUNTY_CHANGES
+                    )
+                    if not added:
+                        # No new alerts, so at most the changed alerts are left to say
+                        alerts_to_say = changed_alerts if say_changed else {}
+                    else:
+                        alerts_to_say = {
+                            alert: counties
+                            for alert, counties in alerts.items()
+                            if alert in added
+                        }
+                        if say_changed:
+                            alerts_to_say.update(changed_alerts)
 
                 # Sort alerts based on severity
                 alerts_to_say = sort_alerts(alerts_to_say)
@@ -2122,7 +2441,7 @@ def main():
         # If alerts have changed, but none added or removed
         elif changed_alerts:
             # Say changed alerts only if enabled, County IDs have been set up, and there is more than one county code
-            if say_alerts_changed and COUNTY_WAVS and len(COUNTY_CODES) > 1:
+            if say_alerts_changed and ANNOUNCE_COUNTY_CHANGES:
                 # Sort alerts based on severity
                 changed_alerts = sort_alerts(changed_alerts)
                 # Say the alerts
@@ -2132,40 +2451,33 @@ def main():
         if ENABLE_TAILMESSAGE:
             build_tailmessage(alerts)
             if pushover_debug:
-                pushover_message += (
-                    "WX tailmessage removed\n"
-                    if not alerts
-                    else "Built WX tailmessage\n"
+                pushover_parts.append(
+                    "WX tailmessage removed" if not alerts else "Built WX tailmessage"
                 )
 
         # Send pushover message if enabled
         if pushover_enabled:
-            pushover_message = pushover_message.rstrip("\n")
+            pushover_message = "\n".join(pushover_parts)
             LOGGER.debug("Sending Pushover message: %s", pushover_message)
             send_pushover(pushover_message, title="SkywarnPlus")
 
     # If no changes detected in alerts
     else:
         # If this is being run interactively, inform the user that nothing has changed
-        if sys.stdin.isatty():
+        if IS_TTY:
             # Log list of current alerts, unless there aren't any, then current_alerts = "None"
-            if len(alerts) == 0:
-                current_alerts = "None"
-            else:
-                alert_details = []
-                for alert, counties in alerts.items():
-                    counties_str = ", ".join(
-                        sorted(
-                            set(
-                                replace_with_county_name(
-                                    county["county_code"], county_data
-                                )
-                                for county in counties
-                            )
-                        )
+            current_alerts = (
+                "; ".join(
+                    "{} ({})".format(
+                        alert,
+                        format_county_names(
+                            (county["county_code"] for county in counties), county_data
+                        ),
                     )
-                    alert_details.append("{} ({})".format(alert, counties_str))
-                current_alerts = "; ".join(alert_details)
+                    for alert, counties in alerts.items()
+                )
+                or "None"
+            )
 
             LOGGER.info("No change in alerts.")
             LOGGER.info("Current alerts: %s.", current_alerts)